@@ -0,0 +1,245 @@
+# __main__.py
+"""
+Runs the offline benchmark suite.
+
+Usage:
+    python -m benchmarks --output results.json
+    python -m benchmarks --compare benchmarks/baseline.json --speed-threshold 1.0
+    python -m benchmarks --results pr-*.json --compare base-*.json
+"""
+
+import argparse
+import asyncio
+import gc
+import inspect
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+import discord
+
+from .cases import CASES
+
+
+def _run_batch(loop, op, count: int):
+    """
+    Runs op count times and returns the elapsed seconds.
+    """
+    if inspect.iscoroutinefunction(op):
+
+        async def batch():
+            start = time.perf_counter()
+            for _ in range(count):
+                await op()
+            return time.perf_counter() - start
+
+        return loop.run_until_complete(batch())
+
+    start = time.perf_counter()
+    for _ in range(count):
+        op()
+    return time.perf_counter() - start
+
+
+class _AllocationCounter:
+    """
+    Sums every increase in traced memory between bytecode instructions.
+
+    tracemalloc only reports memory that is currently live, so memory that is
+    allocated and freed again within an operation would not show up in a
+    snapshot or peak. Sampling after every instruction catches it.
+    Allocations made and freed inside a single C call are still not counted.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self._last = 0
+        # Returning self.trace would allocate a new bound method on every event
+        self._trace = self.trace
+
+    def trace(self, frame, event, arg):
+        frame.f_trace_opcodes = True
+        current = tracemalloc.get_traced_memory()[0]
+        # Growth before a "call" event is the new frame, which only becomes a heap
+        # object because it is being traced, so it is not counted
+        if event != "call" and current > self._last:
+            self.total += current - self._last
+        self._last = current
+        return self._trace
+
+
+def _measure_allocations(loop, op, samples: int):
+    """
+    Returns the average bytes allocated by a single run of op.
+    """
+    counter = _AllocationCounter()
+
+    async def sample():
+        for _ in range(samples):
+            counter._last = tracemalloc.get_traced_memory()[0]
+            sys.settrace(counter.trace)
+            try:
+                result = op()
+                if inspect.isawaitable(result):
+                    await result
+            finally:
+                sys.settrace(None)
+
+    tracemalloc.start()
+    try:
+        loop.run_until_complete(sample())
+    finally:
+        tracemalloc.stop()
+
+    return counter.total / samples
+
+
+async def _cancel_pending():
+    """
+    Cancels leftover tasks, such as queued notification digests.
+    """
+    pending = asyncio.all_tasks() - {asyncio.current_task()}
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+
+
+def run_case(case, min_time: float, alloc_events: int):
+    loop = asyncio.new_event_loop()
+    try:
+        setup = case.factory()
+        if inspect.isawaitable(setup):
+            setup = loop.run_until_complete(setup)
+        op, cleanup = setup
+
+        # Warm up caches and grow any lists to a steady state
+        _run_batch(loop, op, 100)
+
+        # Size batches to roughly a tenth of min_time, then keep the fastest one.
+        # The fastest batch is the least disturbed by other load on the machine.
+        batch = 1
+        while _run_batch(loop, op, batch) < min_time / 10:
+            batch *= 2
+
+        gc.collect()
+        best = min(_run_batch(loop, op, batch) for _ in range(10))
+
+        # Trace at least alloc_events events, and at least one run
+        alloc_runs = -(-alloc_events // case.events)
+        alloc_per_run = _measure_allocations(loop, op, alloc_runs)
+
+        if cleanup:
+            result = cleanup()
+            if inspect.isawaitable(result):
+                loop.run_until_complete(result)
+    finally:
+        loop.run_until_complete(_cancel_pending())
+        loop.close()
+
+    return {
+        "events_per_sec": round(batch * case.events / best, 1),
+        "alloc_bytes_per_event": round(alloc_per_run / case.events, 1),
+    }
+
+
+def load_results(paths: list):
+    """
+    Loads one or more result files and returns the median of each metric.
+    """
+    runs = []
+    for path in paths:
+        with open(path) as f:
+            runs.append(json.load(f)["results"])
+
+    results = {}
+    for name in runs[0]:
+        samples = [run[name] for run in runs if name in run]
+        results[name] = {
+            metric: statistics.median(sample[metric] for sample in samples)
+            for metric in samples[0]
+        }
+    return results
+
+
+def compare(results: dict, baseline: dict, speed_threshold: float, alloc_threshold: float):
+    """
+    Returns a list of regression messages, empty if none were found.
+    """
+    regressions = []
+
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+
+        min_speed = previous["events_per_sec"] * (1 - speed_threshold)
+        if current["events_per_sec"] < min_speed:
+            regressions.append(
+                f"{name}: events/sec {current['events_per_sec']} < {min_speed:.1f} (baseline {previous['events_per_sec']})"
+            )
+
+        max_alloc = previous["alloc_bytes_per_event"] * (1 + alloc_threshold)
+        if current["alloc_bytes_per_event"] > max_alloc:
+            regressions.append(
+                f"{name}: alloc bytes/event {current['alloc_bytes_per_event']} > {max_alloc:.1f} (baseline {previous['alloc_bytes_per_event']})"
+            )
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--output", help="Write results as JSON to this file.")
+    parser.add_argument("--compare", nargs="+", help="Baseline JSON file(s) to compare against. Medians are used.")
+    parser.add_argument("--results", nargs="+", help="Compare these result file(s) instead of running the suite. Medians are used.")
+    parser.add_argument("--filter", default="", help="Only run cases containing this string.")
+    parser.add_argument("--min-time", type=float, default=1.0, help="Seconds to time each case.")
+    parser.add_argument("--alloc-events", type=int, default=200, help="Events to trace when measuring allocations.")
+    parser.add_argument("--speed-threshold", type=float, default=0.25, help="Allowed events/sec drop (0.25 = 25%%).")
+    parser.add_argument("--alloc-threshold", type=float, default=0.10, help="Allowed alloc bytes/event growth (0.10 = 10%%).")
+    args = parser.parse_args(argv)
+
+    if args.results:
+        results = load_results(args.results)
+    else:
+        results = {}
+        for name, case in CASES.items():
+            if args.filter not in name:
+                continue
+            results[name] = run_case(case, args.min_time, args.alloc_events)
+            print(
+                f"{name:<32} {results[name]['events_per_sec']:>12.1f} events/s "
+                f"{results[name]['alloc_bytes_per_event']:>10.1f} B/event"
+            )
+
+    report = {
+        "python": platform.python_version(),
+        "discord.py": discord.__version__,
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+    if args.compare:
+        regressions = compare(
+            results, load_results(args.compare), args.speed_threshold, args.alloc_threshold
+        )
+        if regressions:
+            print("\nRegressions found:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+
+        print(f"\nNo regressions against {', '.join(args.compare)}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
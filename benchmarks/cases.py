@@ -0,0 +1,249 @@
+# cases.py
+"""
+Benchmark cases for the cog hot paths.
+Each case builds a fresh stubbed guild and returns the operation to measure.
+"""
+
+import json
+import logging
+
+from discord import utils
+
+from src.common import Common
+from src.admin_events import admin_events
+from src.gateway_throughput import ThroughputWebSocket, gateway_throughput
+from src.lobby_handler import lobby_handler
+from src.lobby_notifications import lobby_notifications
+
+from . import gateway
+from .stubs import FakeBot, FakeMember, FakeVoiceState, build_guild
+
+CASES = {}
+
+
+class Case:
+    """
+    A registered benchmark.
+    events is the number of gateway events (or calls) a single run represents.
+    It may be a callable, for counts that are only known once the case's data is loaded.
+    """
+
+    def __init__(self, name: str, factory, events=1):
+        self.name = name
+        self.factory = factory
+        self._events = events
+
+    @property
+    def events(self):
+        if callable(self._events):
+            self._events = self._events()
+        return self._events
+
+
+def benchmark(name: str, events=1):
+    """
+    Registers a case factory.
+    The factory returns (operation, cleanup).
+    The factory, the operation, and the cleanup may each be coroutine functions.
+    """
+
+    def decorator(factory):
+        CASES[name] = Case(name, factory, events)
+        return factory
+
+    return decorator
+
+
+def _logger():
+    logger = logging.getLogger("benchmarks")
+    logger.setLevel(logging.WARNING)
+    return logger
+
+
+def _setup():
+    """
+    Builds a stubbed guild with the lobby cogs loaded.
+    Notification windows are long enough that no digest is sent mid-run.
+    """
+    env = build_guild()
+    logger = _logger()
+    bot = FakeBot(env["bot_user"])
+
+    notifications = lobby_notifications(bot, logger, base_window=3600, max_window=3600)
+    bot.add_cog(notifications)
+    handler = lobby_handler(bot, logger)
+    bot.add_cog(handler)
+
+    env["bot"] = bot
+    env["handler"] = handler
+    env["notifications"] = notifications
+    env["member"] = env["guild"].members[1]
+    return env
+
+
+@benchmark("voice_state_noop")
+def voice_state_noop():
+    """
+    Mute/deafen style update where the member's channel did not change.
+    """
+    env = _setup()
+    handler, member = env["handler"], env["member"]
+    state = FakeVoiceState(env["lobby_voice"])
+
+    async def op():
+        await handler.on_voice_state_update(member, state, state)
+
+    return op, None
+
+
+@benchmark("voice_state_join_leave_lobby", events=2)
+def voice_state_join_leave_lobby():
+    """
+    Member joins and leaves an existing lobby that stays occupied.
+    """
+    env = _setup()
+    handler, member, notifications = env["handler"], env["member"], env["notifications"]
+    lobby_voice = env["lobby_voice"]
+    lobby_voice.members.append(env["guild"].members[2])
+
+    outside = FakeVoiceState(None)
+    inside = FakeVoiceState(lobby_voice)
+
+    async def op():
+        await handler.on_voice_state_update(member, outside, inside)
+        await handler.on_voice_state_update(member, inside, outside)
+
+    def cleanup():
+        notifications.discard(env["lobby_text"])
+
+    return op, cleanup
+
+
+@benchmark("common_is_lobby")
+def common_is_lobby():
+    lobby = _setup()["lobby"]
+
+    def op():
+        Common.is_lobby(lobby)
+
+    return op, None
+
+
+@benchmark("common_ctx_is_lobby")
+def common_ctx_is_lobby():
+    env = _setup()
+    common = Common()
+
+    class Context:
+        channel = env["lobby_text"]
+
+    ctx = Context()
+
+    def op():
+        common.ctx_is_lobby(ctx)
+
+    return op, None
+
+
+@benchmark("lobby_text_channel_init")
+def lobby_text_channel_init():
+    """
+    Overwrite map construction plus the welcome message.
+    """
+    env = _setup()
+    handler, lobby = env["handler"], env["lobby"]
+
+    async def op():
+        channel = await handler.initialize_lobby_text_channel(lobby)
+        await channel.delete()
+
+    return op, None
+
+
+@benchmark("lobby_welcome_embed")
+def lobby_welcome_embed():
+    env = _setup()
+    handler, lobby_text = env["handler"], env["lobby_text"]
+
+    async def op():
+        await handler.send_lobby_welcome_message(lobby_text)
+
+    return op, None
+
+
+@benchmark("admin_welcome_embed")
+def admin_welcome_embed():
+    env = _setup()
+    cog = admin_events(env["bot"], _logger())
+
+    def op():
+        cog.get_welcome_message()
+
+    return op, None
+
+
+@benchmark("lobby_create_teardown_cycle", events=3)
+def lobby_create_teardown_cycle():
+    """
+    Member creates a lobby, is moved into it, then leaves and it is deleted.
+    """
+    env = _setup()
+    handler, guild = env["handler"], env["guild"]
+    member = FakeMember("cycler", guild)
+    guild.members.append(member)
+
+    outside = FakeVoiceState(None)
+    seed = FakeVoiceState(env["seed_channel"])
+
+    async def op():
+        await handler.on_voice_state_update(member, outside, seed)
+
+        lobby_voice = guild.categories[-1].voice_channels[0]
+        inside = FakeVoiceState(lobby_voice)
+        await handler.on_voice_state_update(member, seed, inside)
+        await handler.on_voice_state_update(member, inside, outside)
+
+    return op, None
+
+
+@benchmark("gateway_replay_default", events=gateway.replay_event_count)
+async def gateway_replay_default():
+    """
+    Replays the gateway stream through discord.py's stock websocket.
+    JSON is decoded with json, as it is when orjson is not installed.
+    """
+    frames = gateway.replay_stream()[1]
+    bot = gateway.build_client()
+    ws = gateway.build_websocket(bot)
+    from_json = utils._from_json
+    utils._from_json = json.loads
+
+    async def op():
+        await gateway.replay(ws, frames)
+
+    def cleanup():
+        utils._from_json = from_json
+
+    return op, cleanup
+
+
+@benchmark("gateway_replay_throughput", events=gateway.replay_event_count)
+async def gateway_replay_throughput():
+    """
+    Replays the gateway stream with GATEWAY_THROUGHPUT_MODE enabled.
+    """
+    frames = gateway.replay_stream()[1]
+    bot = gateway.build_client()
+    cog = gateway_throughput(bot, _logger())
+    cog.install_decoder()
+    cog.install_filters()
+    ws = gateway.build_websocket(bot, ThroughputWebSocket)
+
+    async def op():
+        await gateway.replay(ws, frames)
+
+    def cleanup():
+        cog.remove_decoder()
+        cog.remove_filters()
+
+    return op, cleanup
@@ -0,0 +1,217 @@
+# gateway.py
+"""
+Offline gateway stream replay.
+
+A recorded stream is a JSON-lines file of raw gateway payloads ({"op", "t", "s", "d"}),
+as written by GATEWAY_THROUGHPUT_MODE with GATEWAY_RECORD_PATH set.
+Set BENCHMARK_GATEWAY_RECORDING to replay one; otherwise a synthetic stream
+resembling a member-heavy guild is generated.
+"""
+
+import asyncio
+import functools
+import json
+import os
+import random
+import zlib
+
+import discord
+from discord import gateway
+from discord.ext import commands
+
+GUILD_ID = "100000000000000001"
+MEMBER_COUNT = 200
+STREAM_LENGTH = 500
+
+# Share of each event type in the synthetic stream
+SYNTHETIC_MIX = {
+    "GUILD_MEMBER_UPDATE": 40,
+    "TYPING_START": 25,
+    "MESSAGE_REACTION_ADD": 15,
+    "MESSAGE_UPDATE": 10,
+    "MESSAGE_DELETE": 5,
+    "MESSAGE_REACTION_REMOVE": 5,
+}
+
+
+def _user(index: int):
+    return {
+        "id": str(200000000000000000 + index),
+        "username": f"member{index}",
+        "global_name": f"Member {index}",
+        "discriminator": "0",
+        "avatar": None,
+    }
+
+
+def guild_create_payload():
+    """
+    Builds the GUILD_CREATE payload used to populate the cache before replay.
+    """
+    members = [
+        {"user": _user(index), "roles": [], "joined_at": "2023-01-01T00:00:00+00:00", "deaf": False, "mute": False, "flags": 0}
+        for index in range(MEMBER_COUNT)
+    ]
+    return {
+        "id": GUILD_ID,
+        "name": "Replay Guild",
+        "owner_id": members[0]["user"]["id"],
+        "member_count": MEMBER_COUNT,
+        "roles": [
+            {
+                "id": GUILD_ID,
+                "name": "@everyone",
+                "permissions": "0",
+                "position": 0,
+                "color": 0,
+                "hoist": False,
+                "managed": False,
+                "mentionable": False,
+            }
+        ],
+        "channels": [
+            {"id": "300000000000000001", "type": 0, "name": "general", "position": 0, "permission_overwrites": []}
+        ],
+        "members": members,
+        "emojis": [],
+        "stickers": [],
+        "features": [],
+        "threads": [],
+        "voice_states": [],
+        "presences": [],
+        "stage_instances": [],
+        "guild_scheduled_events": [],
+    }
+
+
+def _synthetic_event(event: str, rng: random.Random):
+    user = _user(rng.randrange(MEMBER_COUNT))
+    channel_id = "300000000000000001"
+    message_id = str(400000000000000000 + rng.randrange(10000))
+
+    if event == "GUILD_MEMBER_UPDATE":
+        user["global_name"] = f"Renamed {rng.randrange(1000)}"
+        return {"guild_id": GUILD_ID, "user": user, "roles": [], "joined_at": "2023-01-01T00:00:00+00:00", "flags": 0}
+    if event == "TYPING_START":
+        return {"guild_id": GUILD_ID, "channel_id": channel_id, "user_id": user["id"], "timestamp": 1700000000}
+    if event in ("MESSAGE_REACTION_ADD", "MESSAGE_REACTION_REMOVE"):
+        return {
+            "guild_id": GUILD_ID,
+            "channel_id": channel_id,
+            "message_id": message_id,
+            "user_id": user["id"],
+            "emoji": {"id": None, "name": "👍"},
+        }
+    if event == "MESSAGE_UPDATE":
+        return {"guild_id": GUILD_ID, "channel_id": channel_id, "id": message_id, "content": "edited"}
+    if event == "MESSAGE_DELETE":
+        return {"guild_id": GUILD_ID, "channel_id": channel_id, "id": message_id}
+
+
+def load_stream():
+    """
+    Returns (GUILD_CREATE data, gateway payloads to replay).
+    A recording's GUILD_CREATE events populate the cache before replay instead of being replayed.
+    Only dispatch events are replayed. READY and RESUMED belong to the recorded
+    session and would reset the replay client's state.
+    """
+    path = os.getenv("BENCHMARK_GATEWAY_RECORDING")
+    if path:
+        guilds = []
+        stream = []
+        with open(path) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                payload = json.loads(line)
+                if payload["op"] != 0 or payload["t"] in ("READY", "RESUMED"):
+                    continue
+                if payload["t"] == "GUILD_CREATE":
+                    guilds.append(payload["d"])
+                else:
+                    stream.append(payload)
+
+        if not stream:
+            raise ValueError(f"{path} contains no dispatch events to replay.")
+        return guilds, stream
+
+    rng = random.Random(0)
+    events = rng.choices(list(SYNTHETIC_MIX), weights=list(SYNTHETIC_MIX.values()), k=STREAM_LENGTH)
+    return [guild_create_payload()], [
+        {"op": 0, "t": event, "s": seq, "d": _synthetic_event(event, rng)}
+        for seq, event in enumerate(events, start=1)
+    ]
+
+
+def compress_stream(payloads: list):
+    """
+    Encodes payloads as zlib-stream websocket frames.
+    Every tenth payload is split across two frames, as Discord does for large payloads.
+    """
+    compressor = zlib.compressobj()
+    frames = []
+    for index, payload in enumerate(payloads):
+        data = compressor.compress(json.dumps(payload).encode("utf-8"))
+        data += compressor.flush(zlib.Z_SYNC_FLUSH)
+        if index % 10 == 9 and len(data) > 8:
+            middle = len(data) // 2
+            frames.extend([data[:middle], data[middle:]])
+        else:
+            frames.append(data)
+    return frames
+
+
+@functools.cache
+def replay_stream():
+    """
+    Returns (GUILD_CREATE data, frames, event count) for the replay stream.
+    The stream is loaded and compressed once, on first use.
+    """
+    guilds, payloads = load_stream()
+    return guilds, compress_stream(payloads), len(payloads)
+
+
+def replay_event_count():
+    return replay_stream()[2]
+
+
+def build_client():
+    """
+    Builds a bot with the same intents as main.py and the replay stream's guilds cached.
+    Must be called with a running event loop.
+    """
+    intents = discord.Intents.default()
+    intents.message_content = True
+    intents.members = True
+
+    bot = commands.Bot(
+        command_prefix="/", intents=intents, chunk_guilds_at_startup=False
+    )
+    for guild in replay_stream()[0]:
+        bot._connection.parsers["GUILD_CREATE"](guild)
+    return bot
+
+
+def build_websocket(bot: commands.Bot, cls=gateway.DiscordWebSocket):
+    """
+    Builds a websocket wired to the bot's connection state, without a socket.
+    Mirrors the attributes set by DiscordWebSocket.from_client().
+    """
+    ws = cls(None, loop=asyncio.get_running_loop())
+    ws.token = None
+    ws._connection = bot._connection
+    ws._discord_parsers = bot._connection.parsers
+    ws._dispatch = bot.dispatch
+    ws.call_hooks = bot._connection.call_hooks
+    ws.shard_id = None
+    return ws
+
+
+async def replay(ws, frames: list):
+    """
+    Feeds every frame through the websocket, as a fresh zlib-stream connection.
+    """
+    ws._zlib = zlib.decompressobj()
+    ws._buffer = bytearray()
+    for frame in frames:
+        await ws.received_message(frame)
@@ -0,0 +1,246 @@
+# stubs.py
+"""
+Lightweight stand-ins for the discord.py objects the cogs touch.
+No network calls are made; every coroutine returns immediately.
+"""
+
+import itertools
+
+import discord
+
+_ids = itertools.count(1000)
+
+
+class FakeRole:
+    __slots__ = ("id", "name")
+
+    def __init__(self, name: str):
+        self.id = next(_ids)
+        self.name = name
+
+
+class FakeUser:
+    __slots__ = ("id", "name")
+
+    def __init__(self, name: str):
+        self.id = next(_ids)
+        self.name = name
+
+
+class FakeMember:
+    __slots__ = ("id", "name", "display_name", "guild", "roles", "voice")
+
+    def __init__(self, name: str, guild: "FakeGuild", roles: list = None):
+        self.id = next(_ids)
+        self.name = name
+        self.display_name = name
+        self.guild = guild
+        self.roles = roles or [guild.default_role]
+        self.voice = None
+
+    async def edit(self, voice_channel=None, **kwargs):
+        pass
+
+
+class FakeVoiceState:
+    __slots__ = ("channel",)
+
+    def __init__(self, channel=None):
+        self.channel = channel
+
+
+class FakeMessage:
+    __slots__ = ("author", "channel", "content", "embeds")
+
+    def __init__(self, author, channel, content=None, embeds=None):
+        self.author = author
+        self.channel = channel
+        self.content = content
+        self.embeds = embeds
+
+
+class _FakeChannel:
+    __slots__ = ("id", "name", "guild", "category", "overwrites")
+
+    type = None
+
+    def __init__(self, name: str, guild: "FakeGuild", category=None, overwrites=None):
+        self.id = next(_ids)
+        self.name = name
+        self.guild = guild
+        self.category = category
+        self.overwrites = overwrites or {}
+
+    async def set_permissions(self, target, overwrite=None, **permissions):
+        pass
+
+    async def edit(self, **kwargs):
+        pass
+
+    async def delete(self):
+        if self.category is not None:
+            self.category._channels.remove(self)
+
+
+class FakeTextChannel(_FakeChannel):
+    __slots__ = ("topic",)
+
+    type = discord.ChannelType.text
+
+    def __init__(self, *args, topic: str = "", **kwargs):
+        super().__init__(*args, **kwargs)
+        self.topic = topic
+
+    @property
+    def __class__(self):
+        # Passes isinstance() checks the same way unittest.mock's spec does
+        return discord.TextChannel
+
+    async def send(self, content=None, embeds=None):
+        return FakeMessage(None, self, content, embeds)
+
+
+class FakeVoiceChannel(_FakeChannel):
+    __slots__ = (
+        "members",
+        "bitrate",
+        "user_limit",
+        "video_quality_mode",
+        "nsfw",
+        "slowmode_delay",
+        "rtc_region",
+    )
+
+    type = discord.ChannelType.voice
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.members = []
+        self.bitrate = 64000
+        self.user_limit = 0
+        self.video_quality_mode = discord.VideoQualityMode.auto
+        self.nsfw = False
+        self.slowmode_delay = 0
+        self.rtc_region = None
+
+
+class FakeCategoryChannel(_FakeChannel):
+    __slots__ = ("_channels",)
+
+    type = discord.ChannelType.category
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._channels = []
+
+    @property
+    def channels(self):
+        return list(self._channels)
+
+    @property
+    def text_channels(self):
+        return [c for c in self._channels if c.type is discord.ChannelType.text]
+
+    @property
+    def voice_channels(self):
+        return [c for c in self._channels if c.type is discord.ChannelType.voice]
+
+    async def clone(self, name: str = None):
+        return self.guild.add_category(name or self.name, dict(self.overwrites))
+
+    async def create_text_channel(self, name: str, topic: str = "", overwrites=None):
+        channel = FakeTextChannel(
+            name, self.guild, category=self, overwrites=overwrites, topic=topic
+        )
+        self._channels.append(channel)
+        return channel
+
+    async def create_voice_channel(self, name: str, overwrites=None, **kwargs):
+        channel = FakeVoiceChannel(name, self.guild, category=self, overwrites=overwrites)
+        for key, value in kwargs.items():
+            setattr(channel, key, value)
+        self._channels.append(channel)
+        return channel
+
+    async def delete(self):
+        self.guild.categories.remove(self)
+
+
+class FakeGuild:
+    __slots__ = ("id", "name", "default_role", "members", "categories")
+
+    def __init__(self, name: str):
+        self.id = next(_ids)
+        self.name = name
+        self.default_role = FakeRole("@everyone")
+        self.members = []
+        self.categories = []
+
+    def add_category(self, name: str, overwrites=None):
+        category = FakeCategoryChannel(name, self, overwrites=overwrites)
+        self.categories.append(category)
+        return category
+
+    async def create_category_channel(self, name: str):
+        return self.add_category(name)
+
+
+class FakeBot:
+    """
+    Provides the subset of commands.Bot used by the cogs.
+    """
+
+    def __init__(self, user: FakeUser, command_prefix: str = "/"):
+        self.user = user
+        self.command_prefix = command_prefix
+        self.cogs = {}
+
+    def get_cog(self, name: str):
+        return self.cogs.get(name)
+
+    def add_cog(self, cog):
+        self.cogs[cog.qualified_name] = cog
+
+
+def build_guild(member_count: int = 50):
+    """
+    Builds a guild with a seed lobby channel, an existing lobby, and members.
+    Returns a namespace-style dict of the interesting objects.
+    """
+    guild = FakeGuild("Benchmark Guild")
+    bot_user = FakeUser("Mum")
+    bot_role = FakeRole("Mum")
+    moderators = FakeRole("Moderators")
+
+    bot_member = FakeMember(bot_user.name, guild, roles=[guild.default_role, bot_role])
+    bot_member.id = bot_user.id
+    guild.members.append(bot_member)
+
+    for index in range(member_count):
+        guild.members.append(FakeMember(f"member{index}", guild))
+
+    overwrites = {
+        guild.default_role: discord.PermissionOverwrite(connect=True),
+        moderators: discord.PermissionOverwrite(read_messages=True, manage_channels=True),
+    }
+
+    general = guild.add_category("General", overwrites)
+    seed_channel = FakeVoiceChannel(
+        "Create New Lobby", guild, category=general, overwrites=dict(overwrites)
+    )
+    general._channels.append(seed_channel)
+
+    lobby = guild.add_category("member0's Lobby", dict(overwrites))
+    lobby_voice = FakeVoiceChannel("voice chat", guild, category=lobby)
+    lobby_text = FakeTextChannel("text-chat", guild, category=lobby)
+    lobby._channels.extend([lobby_voice, lobby_text])
+
+    return {
+        "guild": guild,
+        "bot_user": bot_user,
+        "general": general,
+        "seed_channel": seed_channel,
+        "lobby": lobby,
+        "lobby_voice": lobby_voice,
+        "lobby_text": lobby_text,
+    }
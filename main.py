@@ -12,7 +12,9 @@ from src.common import Common
 import src.admin_logging as admin_logging
 import src.lobby_commands as lobby_commands
 import src.lobby_handler as lobby_handler
+import src.lobby_notifications as lobby_notifications
 import src.admin_events as admin_events
+import src.gateway_throughput as gateway_throughput
 
 Common = Common()
 
@@ -42,6 +44,8 @@ APP_DIR = os.getenv("PWD")  # Given by Docker
 TOKEN = os.getenv("DISCORD_TOKEN")
 CONTROLLER_GUILD_ID = int(os.getenv("CONTROLLER_GUILD_ID") or 1154917737827684372)
 CONTROLLER_CHANNEL_ID = int(os.getenv("CONTROLLER_CHANNEL_ID") or 1155579990373568522)
+GATEWAY_THROUGHPUT_MODE = (os.getenv("GATEWAY_THROUGHPUT_MODE") or "false").lower() == "true"
+GATEWAY_RECORD_PATH = os.getenv("GATEWAY_RECORD_PATH")
 
 # Setup intents
 # https://discord.readthedocs.io/en/latest/api.html?highlight=intents#discord.Intents.default
@@ -100,7 +104,10 @@ async def start_bot():
     await admin_logging.setup(BOT, logger, CONTROLLER_GUILD_ID, CONTROLLER_CHANNEL_ID)
     await admin_events.setup(BOT, logger)
     await lobby_commands.setup(BOT, logger, APP_DIR)
+    await lobby_notifications.setup(BOT, logger)
     await lobby_handler.setup(BOT, logger)
+    if GATEWAY_THROUGHPUT_MODE:
+        await gateway_throughput.setup(BOT, logger, GATEWAY_RECORD_PATH)
     await BOT.start(TOKEN)
 
 
@@ -0,0 +1,251 @@
+# gateway_throughput.py
+"""
+Opt-in high-throughput gateway ingest mode.
+Trims per-event work for payloads that nothing in the bot listens to.
+"""
+
+from logging import Logger
+import time
+
+import discord
+from discord import gateway, utils
+from discord.ext import commands, tasks
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ZLIB_SUFFIX = b"\x00\x00\xff\xff"
+
+# Gateway events whose parsers do not touch the guild, channel, role, or member caches
+# that lobbies rely on. Some still update other caches, which go stale while they are
+# skipped: message edits, deletes, and reactions are not applied to bot.cached_messages,
+# and scheduled event user counts are not updated. Nothing in the bot reads those.
+# Each maps to the client events it dispatches; the parser is skipped unless one has a listener.
+SKIPPABLE_EVENTS = {
+    "TYPING_START": ("typing", "raw_typing"),
+    "MESSAGE_UPDATE": ("message_edit", "raw_message_edit"),
+    "MESSAGE_DELETE": ("message_delete", "raw_message_delete"),
+    "MESSAGE_DELETE_BULK": ("bulk_message_delete", "raw_bulk_message_delete"),
+    "MESSAGE_REACTION_ADD": ("reaction_add", "raw_reaction_add"),
+    "MESSAGE_REACTION_REMOVE": ("reaction_remove", "raw_reaction_remove"),
+    "MESSAGE_REACTION_REMOVE_ALL": ("reaction_clear", "raw_reaction_clear"),
+    "MESSAGE_REACTION_REMOVE_EMOJI": ("reaction_clear_emoji", "raw_reaction_clear_emoji"),
+    "INVITE_CREATE": ("invite_create",),
+    "INVITE_DELETE": ("invite_delete",),
+    "INTEGRATION_CREATE": ("integration_create",),
+    "INTEGRATION_UPDATE": ("integration_update",),
+    "INTEGRATION_DELETE": ("raw_integration_delete",),
+    "GUILD_INTEGRATIONS_UPDATE": ("guild_integrations_update",),
+    "WEBHOOKS_UPDATE": ("webhooks_update",),
+    "GUILD_AUDIT_LOG_ENTRY_CREATE": ("audit_log_entry_create",),
+    "AUTO_MODERATION_ACTION_EXECUTION": ("automod_action",),
+    "GUILD_SCHEDULED_EVENT_USER_ADD": ("scheduled_event_user_add",),
+    "GUILD_SCHEDULED_EVENT_USER_REMOVE": ("scheduled_event_user_remove",),
+}
+
+
+class GatewayCounter:
+    """
+    Counts dispatch events received and those filtered before model construction.
+    Other gateway opcodes (HELLO, HEARTBEAT_ACK, ...) never reach a parser and are not counted.
+    """
+
+    def __init__(self):
+        self.received = 0
+        self.filtered = 0
+        self._last_time = time.monotonic()
+        self._last_received = 0
+        self._last_filtered = 0
+
+    @property
+    def dispatched(self):
+        return self.received - self.filtered
+
+    def rates(self):
+        """
+        Returns (received/sec, dispatched/sec) since the previous call.
+        """
+        now = time.monotonic()
+        elapsed = (now - self._last_time) or 1.0
+        received = self.received - self._last_received
+        filtered = self.filtered - self._last_filtered
+
+        self._last_time = now
+        self._last_received = self.received
+        self._last_filtered = self.filtered
+
+        return received / elapsed, (received - filtered) / elapsed
+
+
+class ThroughputWebSocket(gateway.DiscordWebSocket):
+    """
+    DiscordWebSocket that inflates zlib-stream frames without an intermediate copy.
+
+    Discord almost always sends a whole payload per frame. Those are inflated directly,
+    and the reassembly buffer is only used (and reused) for fragmented payloads.
+    """
+
+    async def received_message(self, msg, /):
+        if type(msg) is bytes:
+            buffer = self._buffer
+            if buffer or msg[-4:] != ZLIB_SUFFIX:
+                buffer.extend(msg)
+                if len(msg) < 4 or msg[-4:] != ZLIB_SUFFIX:
+                    return
+                msg = self._zlib.decompress(buffer).decode("utf-8")
+                buffer.clear()
+            else:
+                msg = self._zlib.decompress(msg).decode("utf-8")
+
+        await super().received_message(msg)
+
+
+class gateway_throughput(commands.Cog):
+    def __init__(
+        self,
+        bot: commands.Bot,
+        logger: Logger,
+        record_path: str = None,
+        report_interval: float = 60,
+    ):
+        self.bot: commands.Bot = bot
+        self.logger = logger
+        # JSON-lines file that raw gateway payloads are recorded to, for benchmark replay
+        self.record_path = record_path
+        self._record_file = None
+        self.counter = GatewayCounter()
+        # event -> parser replaced by install_filters()
+        self._original_parsers = {}
+        # JSON decoder replaced by install_decoder()
+        self._original_from_json = None
+        self.report.change_interval(seconds=report_interval)
+
+    async def cog_load(self):
+        # Client.connect() looks the websocket class up at call time
+        discord.client.DiscordWebSocket = ThroughputWebSocket
+        self.counter = GatewayCounter()
+        self.install_decoder()
+        self.install_filters()
+
+        self.logger.info(
+            f"Gateway throughput mode enabled. (orjson: {orjson is not None}, filtering: {len(SKIPPABLE_EVENTS)} event types)"
+        )
+        if orjson is None:
+            self.logger.warning("orjson is not installed, gateway JSON will be decoded with json.")
+
+        if self.record_path:
+            # socket_raw_receive is only dispatched with debug events enabled.
+            # The websocket reads this when it connects.
+            self.bot._enable_debug_events = True
+            self._record_file = open(self.record_path, "a", buffering=1)
+            self.logger.warning(
+                f"Recording raw gateway payloads to {self.record_path}. Recordings contain private guild data."
+            )
+
+        self.report.start()
+
+    async def cog_unload(self):
+        self.report.cancel()
+        discord.client.DiscordWebSocket = gateway.DiscordWebSocket
+        self.remove_decoder()
+        self.remove_filters()
+
+        if self._record_file:
+            self._record_file.close()
+            self._record_file = None
+
+    @commands.Cog.listener()
+    async def on_socket_raw_receive(self, msg: str):
+        """
+        Appends each decompressed gateway payload to the recording, one per line.
+        """
+        if self._record_file:
+            self._record_file.write(msg + "\n")
+
+    def install_decoder(self):
+        """
+        Decodes gateway JSON with orjson, if it is installed.
+        discord.py looks utils._from_json up on every payload, so swapping it takes effect immediately.
+        """
+        if orjson is not None and self._original_from_json is None:
+            self._original_from_json = utils._from_json
+            utils._from_json = orjson.loads
+
+    def remove_decoder(self):
+        """
+        Restores the JSON decoder replaced by install_decoder().
+        """
+        if self._original_from_json is not None:
+            utils._from_json = self._original_from_json
+            self._original_from_json = None
+
+    def install_filters(self):
+        """
+        Wraps every parser to count dispatch events.
+        Skippable payloads without listeners are dropped before parsing.
+        Listeners are checked on every event, so cogs loaded later are still honored.
+        """
+        parsers = self.bot._connection.parsers
+
+        for event, parser in list(parsers.items()):
+            if event in self._original_parsers:
+                continue
+            self._original_parsers[event] = parser
+            names = SKIPPABLE_EVENTS.get(event)
+            if names:
+                parsers[event] = self._filtered(parser, names)
+            else:
+                parsers[event] = self._counted(parser)
+
+    def remove_filters(self):
+        """
+        Restores the parsers replaced by install_filters().
+        """
+        self.bot._connection.parsers.update(self._original_parsers)
+        self._original_parsers.clear()
+
+    def has_listener(self, names: tuple):
+        """
+        Returns True if any of the given client events has a listener.
+        """
+        bot = self.bot
+        for name in names:
+            event = f"on_{name}"
+            if bot.extra_events.get(event) or hasattr(bot, event) or bot._listeners.get(name):
+                return True
+        return False
+
+    def _counted(self, parser):
+        counter = self.counter
+
+        def parse(data):
+            counter.received += 1
+            parser(data)
+
+        return parse
+
+    def _filtered(self, parser, names: tuple):
+        counter = self.counter
+        has_listener = self.has_listener
+
+        def parse(data):
+            counter.received += 1
+            if has_listener(names):
+                parser(data)
+            else:
+                counter.filtered += 1
+
+        return parse
+
+    @tasks.loop(seconds=60)
+    async def report(self):
+        received, dispatched = self.counter.rates()
+        self.logger.info(
+            f"Gateway events/sec: received {received:.1f}, dispatched {dispatched:.1f} (totals: received {self.counter.received}, filtered {self.counter.filtered})"
+        )
+
+
+async def setup(bot: commands.Bot, logger: Logger, record_path: str = None):
+    await bot.add_cog(gateway_throughput(bot, logger, record_path))
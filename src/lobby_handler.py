@@ -236,10 +236,7 @@ class lobby_handler(commands.Cog):
             )
             await channel.set_permissions(member, read_messages=True)
             if channel.name == self.text_channel_name:
-                self.logger.info(
-                    f"Sending member join notification message. ({category.name})"
-                )
-                await channel.send(f"{member.display_name} joined the lobby.")
+                await self._notify(member, channel, joined=True)
 
     # @BOT.command(name="test")
     async def send_lobby_welcome_message(self, text_channel: discord.TextChannel):
@@ -280,11 +277,14 @@ class lobby_handler(commands.Cog):
         """
 
         channels = category.channels
+        notifications = self.bot.get_cog("lobby_notifications")
         self.logger.info(f"Deleting empty category. ({category})")
 
         # Delete all channels
         for channel in channels:
             try:
+                if notifications and isinstance(channel, discord.TextChannel):
+                    notifications.discard(channel)
                 self.logger.info(f"Deleting {channel.type} channel ({channel})")
                 await channel.delete()
             except Exception as e:
@@ -313,16 +313,38 @@ class lobby_handler(commands.Cog):
             try:
                 await channel.set_permissions(member, overwrite=overwrite)
                 if channel.name == self.text_channel_name:
-                    self.logger.info(
-                        f"Sending member leave notification message for {member.name} ({category.name})"
-                    )
-                    await channel.send(f"{member.display_name} left the lobby.")
+                    await self._notify(member, channel, joined=False)
             except Exception as e:
                 self.logger.error(
                     f"Failed to remove permissions on channel {channel.name} ({category.name})"
                 )
                 self.logger.error(f"Exception: {e}")
 
+    async def _notify(
+        self, member: discord.Member, channel: discord.TextChannel, joined: bool
+    ):
+        """
+        Notifies a lobby text channel that a member joined or left.
+        Queued into a digest when lobby_notifications is loaded, otherwise sent directly.
+        """
+        action = "join" if joined else "leave"
+        notifications = self.bot.get_cog("lobby_notifications")
+        if notifications:
+            self.logger.info(
+                f"Queueing member {action} notification message for {member.name} ({channel.category})"
+            )
+            if joined:
+                notifications.queue_join(member, channel)
+            else:
+                notifications.queue_leave(member, channel)
+        else:
+            self.logger.info(
+                f"Sending member {action} notification message for {member.name} ({channel.category})"
+            )
+            await channel.send(
+                f"{member.display_name} {'joined' if joined else 'left'} the lobby."
+            )
+
 
 async def setup(bot: commands.Bot, logger):
     await bot.add_cog(lobby_handler(bot, logger))
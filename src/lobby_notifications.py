@@ -0,0 +1,173 @@
+# lobby_notifications.py
+"""
+lobby_notifications collapses lobby join/leave notifications into digests.
+"""
+
+import asyncio
+import time
+from collections import deque
+from logging import Logger
+
+import discord
+from discord.ext import commands
+
+
+class lobby_notifications(commands.Cog):
+    # Discord allows roughly 5 messages per 5 seconds in a single channel
+    rate_limit = 5
+    rate_period = 5.0
+
+    def __init__(
+        self,
+        bot: commands.Bot,
+        logger: Logger,
+        base_window: float = 2.0,
+        max_window: float = 15.0,
+    ):
+        self.bot: commands.Bot = bot
+        self.logger = logger
+        self.base_window = base_window
+        self.max_window = max_window
+
+        # channel id -> {member id: [display name, net joins]}
+        self._pending: dict[int, dict[int, list]] = {}
+        # channel id -> scheduled flush task
+        self._tasks: dict[int, asyncio.Task] = {}
+        # channel id -> timestamps of recent bot messages
+        self._sent: dict[int, deque] = {}
+
+    async def cog_unload(self):
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks.clear()
+        self._pending.clear()
+        self._sent.clear()
+
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message):
+        """
+        Tracks every message the bot sends, including command replies.
+        These share the channel's rate limit with notification digests.
+        """
+        if message.author == self.bot.user:
+            self._record_send(message.channel.id)
+
+    def queue_join(self, member: discord.Member, channel: discord.TextChannel):
+        """
+        Queues a join notification for the member.
+        """
+        self._queue(member, channel, 1)
+
+    def queue_leave(self, member: discord.Member, channel: discord.TextChannel):
+        """
+        Queues a leave notification for the member.
+        """
+        self._queue(member, channel, -1)
+
+    def discard(self, channel: discord.TextChannel):
+        """
+        Drops any pending notifications for a channel, such as before it is deleted.
+        """
+        self._pending.pop(channel.id, None)
+        self._sent.pop(channel.id, None)
+        task = self._tasks.pop(channel.id, None)
+        if task:
+            task.cancel()
+
+    def get_window(self, channel_id: int):
+        """
+        Returns how long to collect events before sending a digest.
+        The window widens as the channel approaches its rate limit.
+        """
+        recent = len(self._prune(channel_id))
+        pressure = min(recent / self.rate_limit, 1.0)
+        return self.base_window + (self.max_window - self.base_window) * pressure
+
+    @staticmethod
+    def format_digest(events: dict[int, list], max_names: int = 10):
+        """
+        Builds a digest message from pending events.
+        Returns None if all events cancelled out.
+        At most max_names names are listed per group, keeping the message well
+        under Discord's 2000 character limit.
+        Example: "Alice, Bob and 12 others joined; Carol left the lobby."
+        """
+        joined = [name for (name, net) in events.values() if net > 0]
+        left = [name for (name, net) in events.values() if net < 0]
+
+        def names(group: list):
+            if len(group) <= max_names:
+                return ", ".join(group)
+            others = len(group) - max_names
+            return f"{', '.join(group[:max_names])} and {others} other{'s' if others > 1 else ''}"
+
+        parts = []
+        if joined:
+            parts.append(f"{names(joined)} joined")
+        if left:
+            parts.append(f"{names(left)} left")
+
+        if not parts:
+            return None
+
+        return f"{'; '.join(parts)} the lobby."
+
+    def _queue(self, member: discord.Member, channel: discord.TextChannel, delta: int):
+        events = self._pending.setdefault(channel.id, {})
+        entry = events.setdefault(member.id, [member.display_name, 0])
+        entry[0] = member.display_name
+        entry[1] += delta
+
+        if channel.id not in self._tasks:
+            window = self.get_window(channel.id)
+            self.logger.debug(
+                f"Scheduling lobby notification digest in {window:.1f}s. ({channel.category})"
+            )
+            self._tasks[channel.id] = asyncio.create_task(self._flush(channel, window))
+
+    async def _flush(self, channel: discord.TextChannel, window: float):
+        try:
+            await asyncio.sleep(window)
+        finally:
+            if self._tasks.get(channel.id) is asyncio.current_task():
+                del self._tasks[channel.id]
+
+        events = self._pending.pop(channel.id, {})
+        message = self.format_digest(events)
+        if not message:
+            return
+
+        try:
+            self.logger.info(
+                f"Sending lobby notification digest. ({channel.category})"
+            )
+            await channel.send(message)
+        except Exception as e:
+            self.logger.error(
+                f"Failed to send lobby notification digest. ({channel.category})"
+            )
+            self.logger.error(f"Exception: {e}")
+
+    def _record_send(self, channel_id: int):
+        # Prune every channel, so channels the bot no longer posts in are dropped
+        for sent_channel_id in list(self._sent):
+            self._prune(sent_channel_id)
+        self._sent.setdefault(channel_id, deque()).append(time.monotonic())
+
+    def _prune(self, channel_id: int):
+        sent = self._sent.get(channel_id)
+        if sent is None:
+            return ()
+
+        cutoff = time.monotonic() - self.rate_period
+        while sent and sent[0] < cutoff:
+            sent.popleft()
+
+        if not sent:
+            del self._sent[channel_id]
+
+        return sent
+
+
+async def setup(bot: commands.Bot, logger: Logger):
+    await bot.add_cog(lobby_notifications(bot, logger))
@@ -0,0 +1,97 @@
+# test_lobby_notifications.py
+"""
+Tests for lobby join/leave digests.
+Run with: python -m unittest
+"""
+
+import asyncio
+import logging
+import unittest
+
+from src.lobby_notifications import lobby_notifications
+
+
+class FakeMember:
+    def __init__(self, member_id: int, name: str):
+        self.id = member_id
+        self.display_name = name
+
+
+class FakeChannel:
+    id = 1
+    category = "Test Lobby"
+
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, content):
+        self.sent.append(content)
+
+
+class FakeBot:
+    user = None
+
+    def get_cog(self, name):
+        return None
+
+
+class DigestTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.cog = lobby_notifications(
+            FakeBot(), logging.getLogger("tests"), base_window=0, max_window=0
+        )
+        self.channel = FakeChannel()
+
+    async def flush(self):
+        await asyncio.gather(*self.cog._tasks.values())
+
+    async def test_join_then_leave_cancels_out(self):
+        member = FakeMember(1, "Alice")
+        self.cog.queue_join(member, self.channel)
+        self.cog.queue_leave(member, self.channel)
+        await self.flush()
+
+        self.assertEqual(self.channel.sent, [])
+
+    async def test_digest_groups_joins_and_leaves(self):
+        self.cog.queue_join(FakeMember(1, "Alice"), self.channel)
+        self.cog.queue_join(FakeMember(2, "Bob"), self.channel)
+        self.cog.queue_leave(FakeMember(3, "Carol"), self.channel)
+        await self.flush()
+
+        self.assertEqual(self.channel.sent, ["Alice, Bob joined; Carol left the lobby."])
+
+    async def test_unload_cancels_pending_digest(self):
+        self.cog.base_window = self.cog.max_window = 60
+        self.cog.queue_join(FakeMember(1, "Alice"), self.channel)
+        task = self.cog._tasks[self.channel.id]
+        await self.cog.cog_unload()
+        await asyncio.gather(task, return_exceptions=True)
+
+        self.assertTrue(task.cancelled())
+        self.assertEqual(self.cog._pending, {})
+
+
+class FormatDigestTests(unittest.TestCase):
+    def events(self, count: int, net: int):
+        return {index: [f"member{index}", net] for index in range(count)}
+
+    def test_names_are_capped(self):
+        message = lobby_notifications.format_digest(self.events(250, 1))
+
+        self.assertTrue(message.startswith("member0, member1,"))
+        self.assertTrue(message.endswith("member9 and 240 others joined the lobby."))
+
+    def test_single_other_is_singular(self):
+        message = lobby_notifications.format_digest(self.events(11, -1))
+
+        self.assertTrue(message.endswith("member9 and 1 other left the lobby."))
+
+    def test_long_names_stay_under_message_limit(self):
+        events = {index: ["x" * 32, 1 if index % 2 else -1] for index in range(1000)}
+
+        self.assertLess(len(lobby_notifications.format_digest(events)), 2000)
+
+
+if __name__ == "__main__":
+    unittest.main()